@@ -1,5 +1,34 @@
-from .db_manager import DBManager
-from .dialect_db_manager import PostgreDBManager, MySQLDBManager, OracleDBManager, MicrosoftSQLServerDBManager, SQLiteDBManager
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .db_manager import DBManager
+    from .dialect_db_manager import PostgreDBManager, MySQLDBManager, OracleDBManager, MicrosoftSQLServerDBManager, SQLiteDBManager
+    from .async_db_manager import AsyncDBManager
+
+
+# Managers are imported on first access, so importing the package does not load SQLAlchemy up front
+_LAZY_IMPORTS = {
+    "DBManager": ".db_manager",
+    "PostgreDBManager": ".dialect_db_manager",
+    "MySQLDBManager": ".dialect_db_manager",
+    "OracleDBManager": ".dialect_db_manager",
+    "MicrosoftSQLServerDBManager": ".dialect_db_manager",
+    "SQLiteDBManager": ".dialect_db_manager",
+    "AsyncDBManager": ".async_db_manager",
+}
+
+
+def __getattr__(name):
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+    value = getattr(import_module(_LAZY_IMPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_IMPORTS))
 
 
 __all__ = [
@@ -7,6 +36,7 @@ __all__ = [
     "PostgreDBManager", 
     "MySQLDBManager", 
     "OracleDBManager", 
-    "MicrosoftSQLServerDBManager"
-    "SQLiteDBManager"
+    "MicrosoftSQLServerDBManager",
+    "SQLiteDBManager",
+    "AsyncDBManager",
 ]
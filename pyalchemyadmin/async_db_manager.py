@@ -0,0 +1,325 @@
+from typing import Dict, List, Optional
+
+from sqlalchemy import insert
+from sqlalchemy.exc import OperationalError, SQLAlchemyError
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import selectinload
+from sqlalchemy.pool import NullPool, StaticPool
+
+from .db_manager import (
+    DBManager,
+    _build_exists,
+    _build_select,
+    _filter_keys,
+    _filter_params,
+    _split_filters,
+    _text_clause,
+)
+
+
+class AsyncDBManager:
+
+    # Supported dialects and their asyncio engines, the first one being the default
+    AVAILABLE_ENGINES = {
+        "postgresql": ["asyncpg", "psycopg"],
+        "mysql": ["aiomysql"],
+        "sqlite": ["aiosqlite"],
+    }
+    DEFAULT_PORTS = {
+        "postgresql": 5432,
+        "mysql": 3306,
+    }
+
+    # Declarative base shared with the synchronous managers
+    _base = DBManager._base
+
+    def __init__(
+        self,
+        *,
+        database: str,
+        user: str = "",
+        password: str = "",
+        host: str = "",
+        port: Optional[int] = None,
+        dialect: str = "postgresql",
+        engine: str = "",
+        echo: bool = False,
+        pool_size: int = 25,
+        max_overflow: int = 25,
+        pool_pre_ping: bool = True,
+        pool_recycle: int = 1800,
+        pool_timeout: int = 30,
+        statement_cache_size: int = 500,
+        use_null_pool: bool = False,
+        expire_on_commit: bool = False,
+        query_cache_size: int = 1200,
+        insertmanyvalues_page_size: int = 1000,
+    ):
+        """
+        Initializes the asyncio database engine and session.
+
+        Args:
+            database (str): The name of the database.
+            user (str, optional): The username for the database. Not used by SQLite.
+            password (str, optional): The password for the database. Not used by SQLite.
+            host (str, optional): The host of the database. Not used by SQLite.
+            port (int, optional): The port of the database. Defaults to the dialect's default port.
+            dialect (str, optional): The dialect of the database. Defaults to "postgresql".
+            engine (str, optional): The asyncio engine of the database. Defaults to the first engine of
+                `AVAILABLE_ENGINES` for the dialect (asyncpg, aiomysql or aiosqlite).
+            echo (bool, optional): If True, the engine will log all the SQL it executes. Defaults to False.
+            pool_size (int, optional): The number of connections kept open in the pool. Defaults to 25.
+            max_overflow (int, optional): The number of connections allowed beyond `pool_size`. Defaults to 25.
+            pool_pre_ping (bool, optional): If True, connections are tested before being checked out of the pool.
+                Defaults to True.
+            pool_recycle (int, optional): The number of seconds after which a pooled connection is replaced.
+                Defaults to 1800.
+            pool_timeout (int, optional): The number of seconds to wait for a free connection before giving up.
+                Defaults to 30.
+            statement_cache_size (int, optional): The number of prepared statements cached per connection,
+                passed to asyncpg as `prepared_statement_cache_size`. psycopg prepares queries server-side after
+                5 executions by default, and 0 turns this off. Set it to 0 behind PgBouncer in transaction pooling
+                mode. Defaults to 500.
+            use_null_pool (bool, optional): If True, connections are closed on release instead of being pooled.
+                Defaults to False.
+            expire_on_commit (bool, optional): If True, instances are expired on commit. Expired attributes cannot
+                be reloaded implicitly under asyncio. Defaults to False.
+            query_cache_size (int, optional): The number of compiled SQL statements cached by the engine.
+                Defaults to 1200.
+            insertmanyvalues_page_size (int, optional): The number of rows per multi-row INSERT. Defaults to 1000.
+
+        Note: The pool options do not apply to SQLite. An in-memory SQLite database always shares a single connection
+        through `StaticPool`.
+        """
+        if dialect not in self.AVAILABLE_ENGINES:
+            raise ValueError(f"Dialect '{dialect}' is not supported.")
+        engine = engine or self.AVAILABLE_ENGINES[dialect][0]
+        if engine not in self.AVAILABLE_ENGINES[dialect]:
+            raise ValueError(
+                f"Engine '{engine}' is not supported for dialect '{dialect}'."
+            )
+
+        try:
+            self._database_url = DBManager._construct_database_url(
+                dialect=dialect,
+                database=database,
+                user=user,
+                password=password,
+                host=host,
+                port=port if port is not None else self.DEFAULT_PORTS.get(dialect),
+                engine=engine,
+            )
+            connect_args = {}
+            if engine == "asyncpg":
+                connect_args["prepared_statement_cache_size"] = statement_cache_size
+            elif engine == "psycopg" and not statement_cache_size:
+                connect_args["prepare_threshold"] = None
+            if dialect == "sqlite" and database == ":memory:":
+                pool_options = {"poolclass": StaticPool}
+            elif use_null_pool:
+                pool_options = {"poolclass": NullPool}
+            elif dialect == "sqlite":
+                pool_options = {}
+            else:
+                pool_options = {
+                    "pool_size": pool_size,
+                    "max_overflow": max_overflow,
+                    "pool_pre_ping": pool_pre_ping,
+                    "pool_recycle": pool_recycle,
+                    "pool_timeout": pool_timeout,
+                }
+            self._engine = create_async_engine(
+                self._database_url,
+                echo=echo,
+                query_cache_size=query_cache_size,
+                insertmanyvalues_page_size=insertmanyvalues_page_size,
+                connect_args=connect_args,
+                **pool_options,
+            )
+            self._session = async_sessionmaker(
+                bind=self._engine, autoflush=False, expire_on_commit=expire_on_commit
+            )
+        except SQLAlchemyError as e:
+            raise ValueError(
+                f"An error occurred while creating the database session: {e}"
+            )
+
+    # Model validation is shared with the synchronous managers
+    base = DBManager.base
+    _validate_column_existence = DBManager._validate_column_existence
+    _validate_relationship_existence = DBManager._validate_relationship_existence
+
+    @property
+    def session(self):
+        return self._session
+
+    async def create_all_tables(self) -> None:
+        """Create all tables in the database using the engine."""
+        try:
+            async with self._engine.begin() as connection:
+                await connection.run_sync(self._base.metadata.create_all)
+        except OperationalError as e:
+            raise ValueError(f"An error occurred while creating tables: {e}")
+
+    async def dispose(self) -> None:
+        """Closes all pooled connections of the engine."""
+        await self._engine.dispose()
+
+    ### Native SQL Operations ###
+
+    async def execute(
+        self, query_string, params: Optional[Dict] = None, fetch: bool = False
+    ):
+        """
+        Executes an SQL command with optional parameters and can return results.
+
+        Args:
+            query_string (str): SQL command to execute.
+            params (Dict[str, Any], optional): Parameters for the SQL command, preventing SQL injection.
+            fetch (bool, optional): If True, returns the result set of the query. Defaults to False.
+
+        Returns:
+            Any: Result set for retrieval operations if `fetch` is True; otherwise, None.
+
+        Example:
+            >>> rows = await execute("SELECT * FROM users WHERE email = :email", {'email': 'john.doe@example.com'}, fetch=True)
+        """
+        if fetch:
+            async with self._session() as session:
+                result = await session.execute(_text_clause(query_string), params)
+                return result.fetchall()
+        # For non-fetch queries, commit the transaction
+        async with self._session.begin() as session:
+            await session.execute(_text_clause(query_string), params)
+        return None
+
+    ### CRUD Operations ###
+
+    async def create(self, table, return_object: bool = False, **kwargs):
+        """
+        Creates a new record in the specified table with the given values.
+
+        Args:
+            table (Base): The table class into which the record will be inserted.
+            return_object (bool, optional): If True, the record is created through the ORM and the new instance
+                is returned. Defaults to False.
+            **kwargs: Key-value pairs corresponding to the table column names and the values to insert into the new record.
+
+        Returns:
+            The created instance if `return_object` is True; otherwise, None.
+
+        Raises:
+            ValueError: If an error occurs during the creation of the record or
+                        if a specified column in kwargs does not exist in the table.
+
+        Example:
+            >>> await create(Employee, name='John Smith', department='Engineering')
+        """
+        self._validate_column_existence(table, **kwargs)
+        new_record = None
+        try:
+            async with self._session.begin() as session:
+                if return_object:
+                    new_record = table(**kwargs)
+                    session.add(new_record)
+                else:
+                    await session.execute(insert(table), kwargs)
+        except SQLAlchemyError as e:
+            raise ValueError(f"An error occurred while creating a record: {e}")
+        return new_record
+
+    async def retrieve(
+        self,
+        table,
+        complex_conditions: Optional[List] = None,
+        return_columns: List = None,
+        fetch_mode: str = "all",
+        eager: Optional[List[str]] = None,
+        **filters,
+    ):
+        """
+        Retrieves records from a table, supporting both simple and complex filters, with optional column selection and fetch mode.
+
+        Relationships cannot be lazy loaded under asyncio, so any relationship accessed on the returned
+        instances must be listed in `eager`.
+
+        Args:
+            table (Base): Table class to retrieve records from.
+            complex_conditions (List, optional): Advanced SQLAlchemy filter conditions.
+            return_columns (List[str], optional): Columns to return. Returns all if None.
+            fetch_mode (str, optional): 'one' for a single record, 'all' for all matches. Defaults to 'all'.
+            eager (List[str], optional): Relationships to load eagerly with `selectinload`.
+                Cannot be combined with `return_columns`.
+            **filters: Equality filters ({column_name: value}).
+
+        Returns:
+            Depending on `fetch_mode`, either a single model instance ('one') or a list ('all') of instances.
+            Returns specified columns, or all if `return_columns` is None.
+
+        Raises:
+            ValueError: For retrieval errors, if `fetch_mode` is invalid or if `eager` names an unknown relationship.
+
+        Example:
+            >>> articles = await retrieve(Article, eager=['comments'], author='John Doe')
+        """
+        if fetch_mode not in ["all", "one"]:
+            raise ValueError("Invalid fetch mode. Use 'all' or 'one'.")
+
+        return_columns = return_columns or []
+        eager = eager or []
+        if eager and return_columns:
+            raise ValueError("Eager loading cannot be combined with return columns.")
+        self._validate_column_existence(table, *return_columns, **filters)
+        self._validate_relationship_existence(table, *eager)
+        filters, complex_conditions = _split_filters(table, filters, complex_conditions)
+
+        stmt = _build_select(table, _filter_keys(filters), tuple(return_columns))
+        if complex_conditions:
+            stmt = stmt.where(*complex_conditions)
+        if eager:
+            stmt = stmt.options(*[selectinload(getattr(table, name)) for name in eager])
+        if fetch_mode == "one":
+            stmt = stmt.limit(1)
+
+        try:
+            async with self._session() as session:
+                result = await session.execute(stmt, _filter_params(filters))
+                if not return_columns:
+                    result = result.scalars()
+                results = result.all() if fetch_mode == "all" else result.first()
+        except SQLAlchemyError as e:
+            raise ValueError(f"An error occurred while retrieving records: {e}")
+        return results
+
+    ### Additional Operations ###
+
+    async def exists(
+        self, table, complex_conditions: Optional[List] = None, **filters
+    ) -> bool:
+        """
+        Checks if any records in the table match the given simple and complex conditions.
+
+        Args:
+            table (Base): The table class to check for existing records.
+            complex_conditions (List, optional): Advanced SQLAlchemy filter conditions.
+            **filters: Simple equality filters ({column_name: value}).
+
+        Returns:
+            bool: True if at least one record matches the conditions, False otherwise.
+
+        Example:
+            >>> await exists(User, [User.age > 18], name='John Doe')
+        """
+        self._validate_column_existence(table, **filters)
+        filters, complex_conditions = _split_filters(table, filters, complex_conditions)
+
+        stmt = _build_exists(table, _filter_keys(filters))
+        if complex_conditions:
+            stmt = stmt.where(*complex_conditions)
+
+        async with self._session() as session:
+            result = await session.execute(stmt, _filter_params(filters))
+            return result.first() is not None
+
+
+__all__ = ["AsyncDBManager"]
@@ -1,9 +1,224 @@
+import importlib.util
+import itertools
+import os
+import threading
+import weakref
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional
-
-from sqlalchemy import create_engine, inspect, text
+from contextlib import contextmanager
+from functools import lru_cache, partial
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple, Union
+
+from sqlalchemy import (
+    bindparam,
+    create_engine,
+    delete,
+    event,
+    insert,
+    inspect,
+    literal_column,
+    MetaData,
+    select,
+    text,
+    update,
+)
+from sqlalchemy.engine import URL
 from sqlalchemy.exc import OperationalError, SQLAlchemyError
-from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy.orm import DeclarativeBase, raiseload, scoped_session, selectinload, sessionmaker
+from sqlalchemy.pool import NullPool, StaticPool
+from sqlalchemy.sql import ClauseElement
+
+
+# Engines and session factories shared by managers with identical connection settings
+_ENGINE_CACHE: Dict[tuple, Tuple] = {}
+_ENGINE_CACHE_LOCK = threading.Lock()
+
+# Constraint naming convention, so generated constraint names are stable across runs and migrations
+NAMING_CONVENTION = {
+    "ix": "ix_%(column_0_label)s",
+    "uq": "uq_%(table_name)s_%(column_0_name)s",
+    "fk": "fk_%(table_name)s_%(column_0_name)s_%(referred_table_name)s",
+    "pk": "pk_%(table_name)s",
+}
+
+
+class Base(DeclarativeBase):
+    """Declarative base shared by all managers, so models are mapped once per process."""
+
+    metadata = MetaData(naming_convention=NAMING_CONVENTION)
+
+
+def _chunked(records: List[Dict], chunk_size: int) -> Iterator[List[Dict]]:
+    """Yields successive slices of `records` with at most `chunk_size` items."""
+    for start in range(0, len(records), chunk_size):
+        yield records[start : start + chunk_size]
+
+
+@lru_cache(maxsize=None)
+def _column_names(table) -> FrozenSet[str]:
+    """Returns the mapped column names of a table class, memoized per class."""
+    return frozenset(inspect(table).columns.keys())
+
+
+# Number of entries memoized by each statement builder and column validator cache
+_STATEMENT_CACHE_SIZE = 2048
+
+
+def _validation_passed() -> None:
+    """Validator returned when all checked columns exist."""
+
+
+def _raise_validation_error(message: str) -> None:
+    """Validator returned when a check failed, raising the precomputed message."""
+    raise ValueError(message)
+
+
+@lru_cache(maxsize=_STATEMENT_CACHE_SIZE)
+def _make_column_validator(base, table, column_names: FrozenSet[str]) -> Callable[[], None]:
+    """Builds a validator for the given columns of a table, memoized so each key set is only checked once."""
+    if not column_names:
+        return _validation_passed
+    if not issubclass(table, base):
+        return partial(_raise_validation_error, "Invalid table object.")
+    missing = column_names - _column_names(table)
+    if len(missing) == 1:
+        return partial(
+            _raise_validation_error,
+            f"Column '{next(iter(missing))}' does not exist in table '{table.__tablename__}'.",
+        )
+    if missing:
+        missing_columns = ", ".join(f"'{column}'" for column in sorted(missing))
+        return partial(
+            _raise_validation_error,
+            f"Columns {missing_columns} do not exist in table '{table.__tablename__}'.",
+        )
+    return _validation_passed
+
+
+@lru_cache(maxsize=512)
+def _text_clause(query_string: str):
+    """Returns the `TextClause` of a raw SQL string, memoized so repeated queries reuse one instance."""
+    return text(query_string)
+
+
+def _is_sql_expression(value: Any) -> bool:
+    """Checks if a value is an SQL expression (e.g. `User.age + 1`) rather than a literal to bind."""
+    return isinstance(value, ClauseElement) or hasattr(value, "__clause_element__")
+
+
+def _split_filters(table, filters: Dict, complex_conditions: Optional[List]) -> Tuple[Dict, List]:
+    """Splits off equality filters on SQL expressions, which are compared inline instead of bound."""
+    bound_filters = {key: value for key, value in filters.items() if not _is_sql_expression(value)}
+    conditions = list(complex_conditions or [])
+    conditions.extend(getattr(table, key) == value for key, value in filters.items() if key not in bound_filters)
+    return bound_filters, conditions
+
+
+def _filter_keys(filters: Dict) -> FrozenSet[Tuple[str, bool]]:
+    """Returns the cache key of equality filters, as (column_name, is_none) pairs."""
+    return frozenset((key, value is None) for key, value in filters.items())
+
+
+def _filter_params(filters: Dict) -> Dict:
+    """Maps equality filters to the bind parameter names used by the cached statements."""
+    return {f"filter_{key}": value for key, value in filters.items() if value is not None}
+
+
+def _filter_clauses(table, filter_keys: FrozenSet[Tuple[str, bool]]) -> List:
+    """Builds `column == :filter_<column>` clauses for the given filter keys, or `column IS NULL` for None filters."""
+    return [
+        getattr(table, key).is_(None) if is_none else getattr(table, key) == bindparam(f"filter_{key}")
+        for key, is_none in sorted(filter_keys)
+    ]
+
+
+# Engines tried in order when none is given, mapped to the module that provides them
+_PREFERRED_ENGINES = {
+    "postgresql": (("psycopg", "psycopg"), ("psycopg2", "psycopg2")),
+    "mysql": (("mysqldb", "MySQLdb"), ("pymysql", "pymysql")),
+}
+
+
+@lru_cache(maxsize=None)
+def _default_engine(dialect: str) -> str:
+    """Returns the fastest installed engine for the dialect, or "" to let SQLAlchemy pick its default."""
+    for engine, module in _PREFERRED_ENGINES.get(dialect, ()):
+        if importlib.util.find_spec(module) is not None:
+            return engine
+    return ""
+
+
+@lru_cache(maxsize=64)
+def _build_url(dialect, engine, user, password, host, port, database) -> URL:
+    """Builds the database URL, escaping special characters, memoized per connection settings."""
+    drivername = f"{dialect}+{engine}" if engine else dialect
+    if dialect == "sqlite":
+        return URL.create(drivername, database=database if database != ":memory:" else None)
+    return URL.create(
+        drivername=drivername,
+        username=user or None,
+        password=password or None,
+        host=host or None,
+        port=port or None,
+        database=database or None,
+    )
+
+
+@lru_cache(maxsize=_STATEMENT_CACHE_SIZE)
+def _build_select(table, filter_keys: FrozenSet[Tuple[str, bool]], return_columns: Tuple[str, ...]):
+    """Builds a parameterized SELECT statement, memoized per table, filter keys and returned columns."""
+    entities = [getattr(table, column) for column in return_columns] or [table]
+    return select(*entities).where(*_filter_clauses(table, filter_keys))
+
+
+@lru_cache(maxsize=_STATEMENT_CACHE_SIZE)
+def _build_exists(table, filter_keys: FrozenSet[Tuple[str, bool]]):
+    """Builds a parameterized `SELECT 1 ... LIMIT 1` statement, memoized per table and filter keys."""
+    return (
+        select(literal_column("1"))
+        .select_from(table)
+        .where(*_filter_clauses(table, filter_keys))
+        .limit(1)
+    )
+
+
+@lru_cache(maxsize=_STATEMENT_CACHE_SIZE)
+def _build_lock(table, filter_keys: FrozenSet[Tuple[str, bool]]):
+    """Builds a parameterized `SELECT <primary key> ... FOR UPDATE` statement, memoized per table and filter keys."""
+    return (
+        select(*inspect(table).primary_key)
+        .where(*_filter_clauses(table, filter_keys))
+        .with_for_update()
+    )
+
+
+@lru_cache(maxsize=_STATEMENT_CACHE_SIZE)
+def _build_update(table, filter_keys: FrozenSet[Tuple[str, bool]], value_keys: Tuple[str, ...]):
+    """Builds a parameterized UPDATE statement, memoized per table, filter keys and updated columns."""
+    return (
+        update(table)
+        .where(*_filter_clauses(table, filter_keys))
+        .values({key: bindparam(f"value_{key}") for key in value_keys})
+    )
+
+
+@lru_cache(maxsize=_STATEMENT_CACHE_SIZE)
+def _build_bulk_update(table, pk_col: str, value_keys: Tuple[str, ...]):
+    """Builds a Core `UPDATE ... WHERE pk = :filter_<pk>` statement for executemany, memoized per table and columns."""
+    columns = inspect(table).columns
+    return (
+        update(table.__table__)
+        .where(columns[pk_col] == bindparam(f"filter_{pk_col}"))
+        .values({columns[key]: bindparam(f"value_{key}") for key in value_keys})
+    )
+
+
+@lru_cache(maxsize=_STATEMENT_CACHE_SIZE)
+def _build_delete(table, filter_keys: FrozenSet[Tuple[str, bool]], return_columns: Tuple[str, ...] = ()):
+    """Builds a parameterized DELETE statement, memoized per table, filter keys and returned columns."""
+    stmt = delete(table).where(*_filter_clauses(table, filter_keys))
+    if return_columns:
+        stmt = stmt.returning(*[getattr(table, column) for column in return_columns])
+    return stmt.execution_options(synchronize_session=False)
 
 
 class DBManager(ABC):
@@ -11,13 +226,29 @@ class DBManager(ABC):
     dialect = ""
 
     # Supported dialects and engines
-    AVAILABLE_DIALECTS = ["postgresql", "mysql", "oracle", "mssql", "sqlite"]
+    AVAILABLE_DIALECTS = frozenset({"postgresql", "mysql", "oracle", "mssql", "sqlite"})
     AVAILABLE_ENGINES = {
-        "postgresql": ["psycopg2", "pg8000", "asyncpg"],
-        "mysql": ["mysqldb", "pymysql"],
-        "oracle": ["cx_oracle"],
-        "mssql": ["pyodbc", "pymssql"],
-        "sqlite": [""],
+        "postgresql": frozenset({"psycopg2", "psycopg", "pg8000", "asyncpg"}),
+        "mysql": frozenset({"mysqldb", "pymysql"}),
+        "oracle": frozenset({"cx_oracle"}),
+        "mssql": frozenset({"pyodbc", "pymssql"}),
+        "sqlite": frozenset({""}),
+    }
+
+    # Declarative base shared by all managers
+    _base = Base
+
+    # Table sets already created per engine, so warm calls to `create_all_tables` skip the DDL checks
+    _tables_created = weakref.WeakKeyDictionary()
+
+    # Driver connection arguments disabling server-side prepared statements, which psycopg enables by default
+    UNPREPARED_STATEMENT_CONNECT_ARGS = {
+        "psycopg": {"prepare_threshold": None},
+    }
+
+    # Driver specific engine options for batched executemany
+    EXECUTEMANY_ENGINE_OPTIONS = {
+        "psycopg2": {"executemany_mode": "values_plus_batch"},
     }
 
     def __init__(
@@ -31,6 +262,17 @@ class DBManager(ABC):
         dialect: str,
         engine: str = "",
         echo: bool = False,
+        pool_size: int = 25,
+        max_overflow: int = 25,
+        pool_pre_ping: bool = True,
+        pool_recycle: int = 1800,
+        pool_timeout: int = 30,
+        prepared_statements: bool = True,
+        scopefunc: Optional[Callable[[], Any]] = None,
+        use_null_pool: bool = False,
+        expire_on_commit: bool = False,
+        query_cache_size: int = 1200,
+        insertmanyvalues_page_size: int = 1000,
     ):
         """
         Initializes the database engine and session.
@@ -42,15 +284,43 @@ class DBManager(ABC):
             host (str): The host of the database.
             port (int): The port of the database.
             dialect (str): The dialect of the database.
-            engine (str, optional): The engine of the database. Defaults to "".
+            engine (str, optional): The engine of the database. Defaults to the first installed of psycopg and
+                psycopg2 for PostgreSQL, or of mysqldb and pymysql for MySQL; otherwise to SQLAlchemy's default.
             echo (bool, optional): If True, the engine will log all the SQL it executes. Defaults to False.
+            pool_size (int, optional): The number of connections kept open in the pool. Defaults to 25.
+            max_overflow (int, optional): The number of connections allowed beyond `pool_size`. Defaults to 25.
+            pool_pre_ping (bool, optional): If True, connections are tested before being checked out of the pool,
+                replacing stale ones transparently. Defaults to True.
+            pool_recycle (int, optional): The number of seconds after which a pooled connection is replaced.
+                Defaults to 1800.
+            pool_timeout (int, optional): The number of seconds to wait for a free connection before giving up.
+                Defaults to 30.
+            prepared_statements (bool, optional): If False, psycopg's server-side prepared statements, which it
+                creates after 5 executions of a query, are turned off. The flag only matters for disabling them,
+                e.g. behind PgBouncer in transaction pooling mode, where prepared statements cannot be shared
+                between connections. Defaults to True.
+            scopefunc (Callable, optional): Returns the identifier of the current scope for `session_scope`, e.g.
+                `asyncio.current_task` or a web framework's request context. Defaults to the current thread.
+            use_null_pool (bool, optional): If True, connections are opened per checkout and closed on release
+                instead of being pooled, which suits short-lived processes such as CLI scripts or serverless tasks.
+                Defaults to False.
+            expire_on_commit (bool, optional): If True, instances are expired on commit, so their attributes are
+                reloaded with one query per instance on next access. Defaults to False, keeping the loaded values.
+            query_cache_size (int, optional): The number of compiled SQL statements cached by the engine and shared
+                by all of its sessions. Defaults to 1200.
+            insertmanyvalues_page_size (int, optional): The number of rows SQLAlchemy folds into each multi-row
+                `INSERT ... VALUES` statement when inserting many records. Defaults to 1000.
+
+        Note: The pool options do not apply to SQLite. An in-memory SQLite database always shares a single connection
+        through `StaticPool`, since each new connection would otherwise see an empty database.
         """
         if dialect not in self.AVAILABLE_DIALECTS:
             raise ValueError(f"Dialect '{dialect}' is not supported.")
-        if engine and engine not in self.AVAILABLE_ENGINES.get(dialect, []):
+        if engine and engine not in self.AVAILABLE_ENGINES.get(dialect, frozenset()):
             raise ValueError(
                 f"Engine '{engine}' is not supported for dialect '{dialect}'."
             )
+        engine = engine or _default_engine(dialect)
 
         try:
             self._database_url = self._construct_database_url(
@@ -62,62 +332,269 @@ class DBManager(ABC):
                 port=port,
                 engine=engine,
             )
-            self._engine = create_engine(self._database_url, echo=echo)
-            self._session = sessionmaker(
-                bind=self._engine, autocommit=False, autoflush=False
+            connect_args = {}
+            if not prepared_statements:
+                connect_args.update(self.UNPREPARED_STATEMENT_CONNECT_ARGS.get(engine, {}))
+            if dialect == "sqlite":
+                connect_args["check_same_thread"] = False
+            if dialect == "sqlite" and database == ":memory:":
+                pool_options = {"poolclass": StaticPool}
+            elif use_null_pool:
+                pool_options = {"poolclass": NullPool}
+            elif dialect == "sqlite":
+                pool_options = {}
+            else:
+                pool_options = {
+                    "pool_size": pool_size,
+                    "max_overflow": max_overflow,
+                    "pool_pre_ping": pool_pre_ping,
+                    "pool_recycle": pool_recycle,
+                    "pool_timeout": pool_timeout,
+                }
+            self._engine, self._session = self._get_engine(
+                self._database_url,
+                echo=echo,
+                future=True,
+                query_cache_size=query_cache_size,
+                insertmanyvalues_page_size=insertmanyvalues_page_size,
+                connect_args=connect_args,
+                **pool_options,
+                **self.EXECUTEMANY_ENGINE_OPTIONS.get(engine, {}),
             )
-            self._base = declarative_base()
+            if expire_on_commit:
+                self._session = self._make_sessionmaker(self._engine, expire_on_commit=True)
+            self._scoped = scoped_session(self._session, scopefunc=scopefunc)
         except SQLAlchemyError as e:
             raise ValueError(
                 f"An error occurred while creating the database session: {e}"
             )
 
     @staticmethod
-    def _construct_database_url(dialect, database, user, password, host, port, engine):
-        """Constructs the database URL based on the given parameters."""
-        if dialect == "sqlite":
-            return f"sqlite:///{database}" if database != ":memory:" else "sqlite://"
-        else:
-            engine_spec = f"{dialect}+{engine}" if engine else dialect
-            return f"{engine_spec}://{user}:{password}@{host}:{port}/{database}"
+    def _get_engine(database_url: URL, **engine_options) -> Tuple:
+        """
+        Returns the engine and session factory for the given URL and options, creating them on first use.
+
+        Managers with identical settings share one engine, and therefore one connection pool. In-memory
+        SQLite databases are never shared, since each engine holds its own database.
+        """
+        if database_url.get_backend_name() == "sqlite" and not database_url.database:
+            engine = create_engine(database_url, **engine_options)
+            return engine, DBManager._make_sessionmaker(engine)
+
+        key = (
+            database_url,
+            tuple(sorted((name, value) for name, value in engine_options.items() if name != "connect_args")),
+            tuple(sorted(engine_options.get("connect_args", {}).items())),
+        )
+        with _ENGINE_CACHE_LOCK:
+            if key not in _ENGINE_CACHE:
+                engine = create_engine(database_url, **engine_options)
+                _ENGINE_CACHE[key] = (engine, DBManager._make_sessionmaker(engine))
+            return _ENGINE_CACHE[key]
+
+    @staticmethod
+    def _make_sessionmaker(engine, expire_on_commit: bool = False) -> sessionmaker:
+        """Builds the session factory used by the managers."""
+        return sessionmaker(
+            bind=engine,
+            autoflush=False,
+            expire_on_commit=expire_on_commit,
+            future=True,
+        )
+
+    @classmethod
+    def dispose_cached_engines(cls, close: bool = True) -> None:
+        """
+        Disposes the connection pools of all shared engines.
+
+        Call it on shutdown. It also runs automatically in forked child processes with `close=False`,
+        so children open fresh connections instead of reusing the parent's sockets.
+
+        Args:
+            close (bool, optional): If True, pooled connections are closed; otherwise they are only dropped.
+                Defaults to True.
+        """
+        # The lock is not taken, as it may be held by a thread that does not exist in a forked child
+        for engine, _ in list(_ENGINE_CACHE.values()):
+            engine.dispose(close=close)
+
+    @staticmethod
+    def _construct_database_url(dialect, database, user, password, host, port, engine) -> URL:
+        """Constructs the database URL based on the given parameters, escaping special characters."""
+        return _build_url(dialect, engine, user, password, host, port, database)
 
     @property
     def base(self):
-        return self._base
+        return type(self)._base
+
+    @classmethod
+    def get_base(cls):
+        """Returns the declarative base shared by all managers, for defining models without an instance."""
+        return cls._base
 
     @property
     def session(self):
         return self._session
 
+    @contextmanager
+    def session_scope(self) -> Iterator:
+        """
+        Shares one session, connection and transaction between all operations run inside the context.
+
+        Without a scope, every operation opens its own session and commits its own transaction. Inside a scope,
+        operations of the current thread (or of the scope returned by `scopefunc`) reuse the scoped session, and
+        their changes are committed together when the context exits, or rolled back if it raises. A scope opened
+        inside another one joins it, so only the outermost scope commits.
+
+        Yields:
+            Session: The scoped session.
+
+        Example:
+            >>> with db.session_scope():
+            ...     if not db.exists(User, email='jane@example.com'):
+            ...         db.create(User, email='jane@example.com', name='Jane Doe')
+        """
+        # A nested scope joins the outer one, which alone commits or rolls back
+        if self._scoped.registry.has():
+            yield self._scoped()
+            return
+
+        session = self._scoped()
+        try:
+            yield session
+            session.commit()
+        except BaseException:
+            session.rollback()
+            raise
+        finally:
+            self._scoped.remove()
+
+    @contextmanager
+    def _read_session(self) -> Iterator:
+        """Yields the active scoped session, or a new short-lived session outside of `session_scope`."""
+        if self._scoped.registry.has():
+            yield self._scoped()
+        else:
+            with self._session() as session:
+                yield session
+
+    @contextmanager
+    def _write_session(self) -> Iterator:
+        """Yields the active scoped session, or a new session committed on exit outside of `session_scope`."""
+        if self._scoped.registry.has():
+            yield self._scoped()
+        else:
+            with self._session.begin() as session:
+                yield session
+
+    @contextmanager
+    def count_queries(self) -> Iterator[List[str]]:
+        """
+        Records every SQL statement executed through the engine while the context is active.
+
+        Useful for catching N+1 query patterns, e.g. lazy loaded relationships accessed in a loop.
+
+        Yields:
+            List[str]: The executed statements, filled in as they run.
+
+        Example:
+            >>> with db.count_queries() as queries:
+            ...     articles = db.retrieve(Article, eager=['comments'])
+            ...     comments = [comment for article in articles for comment in article.comments]
+            >>> assert len(queries) == 2
+        """
+        queries = []
+
+        def _record_query(conn, cursor, statement, parameters, context, executemany):
+            queries.append(statement)
+
+        event.listen(self._engine, "before_cursor_execute", _record_query)
+        try:
+            yield queries
+        finally:
+            event.remove(self._engine, "before_cursor_execute", _record_query)
+
+    @contextmanager
+    def assert_max_queries(self, max_queries: int) -> Iterator[List[str]]:
+        """
+        Fails if more than `max_queries` SQL statements are executed through the engine while the context is active.
+
+        Args:
+            max_queries (int): The maximum number of statements allowed.
+
+        Yields:
+            List[str]: The executed statements, filled in as they run.
+
+        Raises:
+            AssertionError: If the number of executed statements exceeds `max_queries`.
+
+        Example:
+            >>> with db.assert_max_queries(2):
+            ...     articles = db.retrieve(Article, eager=['comments'])
+            ...     comments = [comment for article in articles for comment in article.comments]
+        """
+        with self.count_queries() as queries:
+            yield queries
+        if len(queries) > max_queries:
+            executed = "\n".join(queries)
+            raise AssertionError(
+                f"Expected at most {max_queries} queries, but {len(queries)} were executed:\n{executed}"
+            )
+
     @abstractmethod
     def lock_table_command(self, table_name: str) -> text:
         """Returns the SQL command to lock a table."""
         pass
 
-    def _has_column(self, table, column_name: str) -> bool:
-        """Check if a column exists in a table."""
-        if not issubclass(table, self._base):
-            raise ValueError("Invalid table object.")
-        inspector = inspect(table)
-        return column_name in inspector.columns.keys()
-
     def _validate_column_existence(self, table, *args, **kwargs) -> None:
         """Validate that all columns exist in the table."""
-        columns_to_check = set(args) | set(kwargs.keys())
-        for column in columns_to_check:
-            if not self._has_column(table, column):
+        _make_column_validator(self._base, table, frozenset(args).union(kwargs))()
+
+    def _validate_relationship_existence(self, table, *relationship_names) -> None:
+        """Validate that all relationships exist on the table."""
+        relationships = inspect(table).relationships.keys()
+        for name in relationship_names:
+            if name not in relationships:
                 raise ValueError(
-                    f"Column '{column}' does not exist in table '{table.__tablename__}'."
+                    f"Relationship '{name}' does not exist in table '{table.__tablename__}'."
                 )
 
-    def create_all_tables(self) -> None:
-        """Create all tables in the database using the engine."""
+    def create_all_tables(self, checkfirst: bool = True, fast: bool = False) -> None:
+        """
+        Create all tables in the database using the engine.
+
+        Once the tables have been created through an engine, later calls for the same set of tables are skipped.
+
+        Args:
+            checkfirst (bool, optional): If True, each table is checked for existence before it is created.
+                Pass False when the schema is known to be absent to save one query per table. Defaults to True.
+            fast (bool, optional): If True, the existing tables are listed with one query per schema and only
+                the missing ones are created, instead of checking each table separately. Defaults to False.
+        """
         if self._engine is None:
             raise ValueError("Engine is not initialized.")
+        metadata = self._base.metadata
+        table_names = frozenset(metadata.tables)
+        created = self._tables_created.setdefault(self._engine, set())
+        if table_names in created:
+            return
         try:
-            self._base.metadata.create_all(self._engine)
+            if fast:
+                inspector = inspect(self._engine)
+                existing = {
+                    (schema, name)
+                    for schema in {table.schema for table in metadata.sorted_tables}
+                    for name in inspector.get_table_names(schema=schema)
+                }
+                missing = [
+                    table for table in metadata.sorted_tables if (table.schema, table.name) not in existing
+                ]
+                metadata.create_all(self._engine, tables=missing, checkfirst=False)
+            else:
+                metadata.create_all(self._engine, checkfirst=checkfirst)
         except OperationalError as e:
             raise ValueError(f"An error occurred while creating tables: {e}")
+        created.add(table_names)
 
     ### Native SQL Operations ###
 
@@ -160,25 +637,142 @@ class DBManager(ABC):
             >>> params = {'export_uuid': request_schema.export_uuid, 'image_uuids': tuple(request_schema.image_uuid)}
             >>> execute(query_string, params)
         """
-        with self._session() as session:
-            result = session.execute(statement=text(query_string), params=params)
-            if fetch:
+        if fetch:
+            with self._read_session() as session:
+                result = session.execute(statement=_text_clause(query_string), params=params)
                 return result.fetchall()
-            else:
-                # For non-fetch queries, commit the transaction
-                session.commit()
-                return None
+        # For non-fetch queries, commit the transaction
+        with self._write_session() as session:
+            session.execute(statement=_text_clause(query_string), params=params)
+        return None
+
+    def execute_first(self, query_string, params: Optional[Dict] = None):
+        """
+        Executes an SQL query and returns only its first row.
+
+        The cursor is closed as soon as the row is read, so the remaining rows are not fetched. The query is
+        not rewritten; add a `LIMIT 1` (or the dialect's equivalent) so the database only produces one row.
+
+        Args:
+            query_string (str): SQL query to execute.
+            params (Dict[str, Any], optional): Parameters for the SQL query, preventing SQL injection.
+
+        Returns:
+            Row: The first row of the result set, or None if it is empty.
+
+        Example:
+            >>> user = execute_first("SELECT * FROM users WHERE email = :email LIMIT 1", {'email': 'john.doe@example.com'})
+        """
+        with self._read_session() as session:
+            return session.execute(_text_clause(query_string), params).first()
+
+    def execute_stream(
+        self, query_string, params: Optional[Dict] = None, yield_per: int = 1000
+    ) -> Iterator:
+        """
+        Executes an SQL query and yields its rows as they are fetched, instead of returning them all at once.
+
+        Rows are read `yield_per` at a time from a server-side cursor on drivers that support one (psycopg2,
+        psycopg, pg8000, mysqldb, pymysql), so memory use stays bounded for large result sets. The session stays
+        open until the generator is exhausted or closed.
+
+        Args:
+            query_string (str): SQL query to execute.
+            params (Dict[str, Any], optional): Parameters for the SQL query, preventing SQL injection.
+            yield_per (int, optional): The number of rows fetched from the cursor at a time. Defaults to 1000.
+
+        Yields:
+            Row: The rows of the result set.
+
+        Example:
+            >>> for row in execute_stream("SELECT * FROM events WHERE kind = :kind", {'kind': 'click'}):
+            >>>     print(row)
+        """
+        with self._read_session() as session:
+            result = session.execute(
+                _text_clause(query_string),
+                params,
+                execution_options={"yield_per": yield_per},
+            )
+            yield from result
+
+    def execute_mappings(self, query_string, params: Optional[Dict] = None) -> List:
+        """
+        Executes an SQL query and returns its rows as dictionary-like mappings keyed by column name.
+
+        Args:
+            query_string (str): SQL query to execute.
+            params (Dict[str, Any], optional): Parameters for the SQL query, preventing SQL injection.
+
+        Returns:
+            List[RowMapping]: The rows of the result set.
+
+        Example:
+            >>> users = execute_mappings("SELECT name, email FROM users")
+            >>> users[0]['email']
+        """
+        with self._read_session() as session:
+            return session.execute(_text_clause(query_string), params).mappings().all()
+
+    def execute_many(
+        self, query_string, params_seq: Iterable[Dict], chunk_size: int = 1000
+    ) -> None:
+        """
+        Executes an SQL command once per parameter set, batching the parameter sets with executemany.
+
+        All parameter sets are executed in a single transaction. They are consumed `chunk_size` at a time,
+        so a generator can be passed without materializing every parameter set in memory.
+
+        Args:
+            query_string (str): SQL command to execute.
+            params_seq (Iterable[Dict[str, Any]]): Parameter sets for the SQL command.
+            chunk_size (int, optional): The maximum number of parameter sets sent per executemany call.
+                Defaults to 1000.
+
+        Raises:
+            ValueError: If `chunk_size` is not positive or an execution error occurs.
+
+        Example:
+            >>> query_string = "INSERT INTO users (name, email) VALUES (:name, :email)"
+            >>> params_seq = [{'name': 'Jane Doe', 'email': 'jane@example.com'}, {'name': 'John Doe', 'email': 'john@example.com'}]
+            >>> execute_many(query_string, params_seq)
+        """
+        if chunk_size < 1:
+            raise ValueError("Chunk size must be a positive integer.")
+
+        statement = _text_clause(query_string)
+        params_iter = iter(params_seq)
+        try:
+            with self._write_session() as session:
+                while True:
+                    chunk = list(itertools.islice(params_iter, chunk_size))
+                    if not chunk:
+                        break
+                    session.execute(statement, chunk)
+        except SQLAlchemyError as e:
+            raise ValueError(f"An error occurred while executing the command: {e}")
 
     ### CRUD Operations ###
 
-    def create(self, table, **kwargs) -> None:
+    def _core_insert(self, session, table, values: Dict) -> None:
+        """Inserts a single record with a Core INSERT, bypassing the ORM unit of work."""
+        session.execute(insert(table), values)
+
+    def create(self, table, return_object: bool = False, **kwargs):
         """
         Creates a new record in the specified table with the given values.
 
+        By default the record is inserted with a Core `INSERT` statement, without constructing an ORM instance.
+
         Args:
             table (Base): The table class into which the record will be inserted.
+            return_object (bool, optional): If True, the record is created through the ORM and the new instance,
+                including its generated primary key, is returned. Defaults to False.
             **kwargs: Key-value pairs corresponding to the table column names and the values to insert into the new record.
 
+        Returns:
+            The created instance if `return_object` is True; otherwise, None.
+
         Raises:
             ValueError: If an error occurs during the creation of the record or
                         if a specified column in kwargs does not exist in the table.
@@ -190,26 +784,40 @@ class DBManager(ABC):
             >>> create(Employee, **employee_data)
             This would create a new record in the Employee table with the name 'John Smith' and department 'Engineering'.
 
+            >>> employee = create(Employee, return_object=True, **employee_data)
+            >>> employee.id
+            This would create the same record and return the `Employee` instance with its generated 'id'.
+
         Note: This method commits the transaction, ensuring that changes are saved to the database.
         """
         self._validate_column_existence(table, **kwargs)
+        new_record = None
         try:
-            with self._session() as session:
-                new_record = table(**kwargs)
-                session.add(new_record)
-                session.commit()
+            with self._write_session() as session:
+                if return_object:
+                    new_record = table(**kwargs)
+                    session.add(new_record)
+                    # Flush now, so the primary key is generated before the instance is returned
+                    session.flush()
+                else:
+                    self._core_insert(session, table, kwargs)
         except SQLAlchemyError as e:
             raise ValueError(f"An error occurred while creating a record: {e}")
+        return new_record
 
-    def bulk_create(self, table, records: List[Dict]) -> None:
+    def bulk_create(self, table, records: List[Dict], chunk_size: int = 1000) -> None:
         """
         Creates multiple new records in the specified table with the given values.
 
+        The records are sent as executemany-style INSERT statements in chunks of `chunk_size`,
+        all within a single transaction.
+
         Args:
             table (Base): The table class into which the records will be inserted.
             records (List[dict]): A list of dictionaries, where each dictionary represents a record to be inserted.
                 The keys in each dictionary should correspond to the table column names, and the values should be
                 the values to insert into the respective columns for each record.
+            chunk_size (int, optional): The maximum number of records sent per INSERT statement. Defaults to 1000.
 
         Raises:
             ValueError: If an error occurs during the creation of the records or if a specified column in any of the
@@ -228,13 +836,15 @@ class DBManager(ABC):
         """
         if not records:
             return
+        if chunk_size < 1:
+            raise ValueError("Chunk size must be a positive integer.")
         for record_data in records:
             self._validate_column_existence(table, **record_data)
 
         try:
-            with self._session() as session:
-                session.bulk_insert_mappings(table, records)
-                session.commit()
+            with self._write_session() as session:
+                for chunk in _chunked(records, chunk_size):
+                    session.execute(insert(table), chunk)
         except SQLAlchemyError as e:
             raise ValueError(f"An error occurred while creating records: {e}")
 
@@ -244,6 +854,7 @@ class DBManager(ABC):
         complex_conditions: Optional[List] = None,
         return_columns: List = None,
         fetch_mode: str = "all",
+        eager: Optional[List[str]] = None,
         **filters,
     ):
         """
@@ -254,6 +865,10 @@ class DBManager(ABC):
             complex_conditions (List, optional): Advanced SQLAlchemy filter conditions.
             return_columns (List[str], optional): Columns to return. Returns all if None.
             fetch_mode (str, optional): 'one' for a single record, 'all' for all matches. Defaults to 'all'.
+            eager (List[str], optional): Relationships to load eagerly with `selectinload`. Each relationship is
+                loaded by one additional `SELECT ... WHERE pk IN (...)` query for all returned records, instead of
+                one lazy query per record. Unlike `joinedload`, this does not duplicate parent rows in the result.
+                Cannot be combined with `return_columns`.
             **filters: Equality filters ({column_name: value}).
 
         Returns:
@@ -261,7 +876,7 @@ class DBManager(ABC):
             Returns specified columns, or all if `return_columns` is None.
 
         Raises:
-            ValueError: For retrieval errors or if `fetch_mode` is invalid.
+            ValueError: For retrieval errors, if `fetch_mode` is invalid or if `eager` names an unknown relationship.
 
         Example:
             Assuming we have a table class `Article` derived from Base, with columns 'id', 'title', 'author':
@@ -277,42 +892,168 @@ class DBManager(ABC):
             >>> condition = Article.title.in_(some_titles)
             >>> articles = retrieve(Article, complex_conditions=[condition])
             This will return a list of `Article` instances for articles whose titles are in the specified list.
+
+            To load the `comments` relationship of every returned article up front:
+
+            >>> articles = retrieve(Article, eager=['comments'], author='John Doe')
+            This will issue two queries in total, no matter how many articles are returned.
         """
         if fetch_mode not in ["all", "one"]:
             raise ValueError("Invalid fetch mode. Use 'all' or 'one'.")
 
         return_columns = return_columns or []
+        eager = eager or []
+        if eager and return_columns:
+            raise ValueError("Eager loading cannot be combined with return columns.")
         self._validate_column_existence(table, *return_columns, **filters)
+        self._validate_relationship_existence(table, *eager)
+        filters, complex_conditions = _split_filters(table, filters, complex_conditions)
+
+        stmt = _build_select(table, _filter_keys(filters), tuple(return_columns))
+        if complex_conditions:
+            stmt = stmt.where(*complex_conditions)
+        if eager:
+            stmt = stmt.options(*[selectinload(getattr(table, name)) for name in eager])
+        if fetch_mode == "one":
+            stmt = stmt.limit(1)
 
         try:
-            with self._session() as session:
-                query = session.query(table).filter_by(**filters)
-                if complex_conditions:
-                    for condition in complex_conditions:
-                        query = query.filter(condition)
-                if return_columns:
-                    query = query.with_entities(
-                        *[getattr(table, col) for col in return_columns]
-                    )
-                results = query.all() if fetch_mode == "all" else query.first()
+            with self._read_session() as session:
+                result = session.execute(stmt, _filter_params(filters))
+                if not return_columns:
+                    result = result.scalars()
+                results = result.all() if fetch_mode == "all" else result.first()
         except SQLAlchemyError as e:
             raise ValueError(f"An error occurred while retrieving records: {e}")
         return results
 
+    def orm_query(
+        self, stmt, *, selectin: Optional[List] = None, raise_unspecified: bool = True
+    ) -> List:
+        """
+        Executes an ORM select statement, loading the given relationships eagerly and refusing any other lazy load.
+
+        Each relationship in `selectin` is loaded by one additional `SELECT ... WHERE pk IN (...)` query. With
+        `raise_unspecified`, accessing any other relationship on the returned instances raises instead of silently
+        issuing one query per instance.
+
+        Args:
+            stmt (Select): The ORM select statement to execute, e.g. `select(Article).where(...)`.
+            selectin (List, optional): Relationship attributes to load eagerly with `selectinload`.
+            raise_unspecified (bool, optional): If True, relationships not listed in `selectin` are set to
+                `raiseload`. Defaults to True.
+
+        Returns:
+            List: The instances of the first entity selected by the statement.
+
+        Raises:
+            ValueError: If an error occurs during the query.
+
+        Example:
+            >>> articles = orm_query(select(Article).where(Article.author == 'John Doe'), selectin=[Article.comments])
+            >>> articles[0].comments  # already loaded
+            >>> articles[0].tags  # raises InvalidRequestError instead of querying
+        """
+        options = [selectinload(attribute) for attribute in selectin or []]
+        if raise_unspecified:
+            options.append(raiseload("*"))
+        if options:
+            stmt = stmt.options(*options)
+
+        try:
+            with self._read_session() as session:
+                return session.execute(stmt).scalars().all()
+        except SQLAlchemyError as e:
+            raise ValueError(f"An error occurred while retrieving records: {e}")
+
+    def _iter_batches(self, stmt, pk, batch_size: int, params: Dict) -> Iterator:
+        """Yields the records of a SELECT ordered by `pk`, fetching `batch_size` records per query."""
+        last_value = None
+        while True:
+            batch_stmt = stmt if last_value is None else stmt.where(pk > last_value)
+            try:
+                with self._read_session() as session:
+                    records = session.execute(batch_stmt, params).scalars().all()
+            except SQLAlchemyError as e:
+                raise ValueError(f"An error occurred while retrieving records: {e}")
+            if not records:
+                return
+            yield from records
+            if len(records) < batch_size:
+                return
+            last_value = getattr(records[-1], pk.key)
+
+    def iter_retrieve(
+        self,
+        table,
+        *,
+        pk_col: str,
+        batch_size: int = 1000,
+        complex_conditions: Optional[List] = None,
+        **filters,
+    ) -> Iterator:
+        """
+        Iterates over the records of a table in batches, using keyset pagination on `pk_col`.
+
+        Each batch is fetched with `WHERE pk_col > <last seen value> ORDER BY pk_col LIMIT batch_size` in its own
+        short session, so memory use stays constant and no transaction is held open between batches.
+
+        Args:
+            table (Base): Table class to retrieve records from.
+            pk_col (str): A unique, sortable column to paginate on, usually the primary key.
+            batch_size (int, optional): The number of records fetched per query. Defaults to 1000.
+            complex_conditions (List, optional): Advanced SQLAlchemy filter conditions.
+            **filters: Equality filters ({column_name: value}).
+
+        Returns:
+            Iterator: The matching model instances, ordered by `pk_col`.
+
+        Raises:
+            ValueError: For retrieval errors or if `batch_size` is not positive. Invalid arguments are reported
+                when `iter_retrieve` is called, before the first batch is fetched.
+
+        Example:
+            >>> for article in iter_retrieve(Article, pk_col='id', batch_size=500, author='John Doe'):
+            >>>     print(article.title)
+            This will stream all articles by John Doe, 500 at a time.
+        """
+        if batch_size < 1:
+            raise ValueError("Batch size must be a positive integer.")
+        self._validate_column_existence(table, pk_col, **filters)
+        filters, complex_conditions = _split_filters(table, filters, complex_conditions)
+
+        pk = getattr(table, pk_col)
+        stmt = _build_select(table, _filter_keys(filters), ())
+        if complex_conditions:
+            stmt = stmt.where(*complex_conditions)
+        stmt = stmt.order_by(pk).limit(batch_size)
+        return self._iter_batches(stmt, pk, batch_size, _filter_params(filters))
+
     def update(
         self,
         table,
         update_values: Dict,
         complex_conditions: Optional[List] = None,
+        synchronize: Union[str, bool, None] = None,
+        for_update: bool = False,
         **filters,
     ) -> None:
         """
         Updates table records based on provided filters, conditions, and new values.
 
+        The update is sent as a single `UPDATE ... WHERE ...` statement. Outside of `session_scope` each call uses
+        its own session, so no ORM objects need to be synchronized by default, which avoids the extra SELECT of the
+        'fetch' strategy. Inside a scope, instances loaded in the shared session are synchronized with 'auto'.
+
         Args:
             table (Base): Table class for the records to update.
-            update_values (Dict): {column_name: new_value} pairs for the update.
+            update_values (Dict): {column_name: new_value} pairs for the update. Values may be SQL expressions,
+                e.g. `{'views': Article.views + 1}`.
             complex_conditions (List, optional): Advanced SQLAlchemy filter conditions.
+            synchronize (str | bool, optional): The ORM `synchronize_session` strategy ('auto', 'evaluate', 'fetch'
+                or False). Defaults to 'auto' inside `session_scope` and to False otherwise.
+            for_update (bool, optional): If True, locks the matching rows with `SELECT ... FOR UPDATE`
+                before updating them. Defaults to False.
             **filters: Simple equality filters ({column_name: value}).
 
         Raises:
@@ -328,19 +1069,103 @@ class DBManager(ABC):
             raise ValueError("No update values provided.")
 
         self._validate_column_existence(table, *update_values.keys(), **filters)
+        filters, complex_conditions = _split_filters(table, filters, complex_conditions)
+
+        if synchronize is None:
+            synchronize = "auto" if self._scoped.registry.has() else False
+        params = _filter_params(filters)
+
+        if synchronize:
+            # The ORM synchronizes loaded instances by evaluating the criteria and values, which it cannot do
+            # for bind parameters, so the statement is built with inline values instead of the cached one
+            stmt = update(table).filter_by(**filters).values(update_values)
+            update_params = {}
+        else:
+            # SQL expressions are rendered inline, only literal values go through the cached bind parameters
+            bound_values = {key: value for key, value in update_values.items() if not _is_sql_expression(value)}
+            expression_values = {key: value for key, value in update_values.items() if key not in bound_values}
+
+            stmt = _build_update(table, _filter_keys(filters), tuple(bound_values))
+            if expression_values:
+                stmt = stmt.values(expression_values)
+            update_params = dict(params)
+            update_params.update({f"value_{key}": value for key, value in bound_values.items()})
+        if complex_conditions:
+            stmt = stmt.where(*complex_conditions)
 
         try:
-            with self._session() as session:
-                query = session.query(table).filter_by(**filters)
-                if complex_conditions:
-                    for condition in complex_conditions:
-                        query = query.filter(condition)
+            with self._write_session() as session:
+                if for_update:
+                    # Lock the selected rows for update
+                    lock_stmt = _build_lock(table, _filter_keys(filters))
+                    if complex_conditions:
+                        lock_stmt = lock_stmt.where(*complex_conditions)
+                    session.execute(lock_stmt, params)
+
+                session.execute(
+                    stmt.execution_options(synchronize_session=synchronize), update_params
+                )
+        except SQLAlchemyError as e:
+            raise ValueError(f"An error occurred while updating records: {e}")
+
+    def _validate_bulk_update_records(
+        self, table, pk_col: str, records: List[Dict]
+    ) -> Tuple[str, ...]:
+        """Validate the records of a bulk update and return the columns to update."""
+        keys = records[0].keys()
+        if pk_col not in keys:
+            raise ValueError(f"Records must contain the key column '{pk_col}'.")
+        if any(record_data.keys() != keys for record_data in records):
+            raise ValueError("All records must contain the same columns.")
+        value_keys = tuple(key for key in keys if key != pk_col)
+        if not value_keys:
+            raise ValueError("No update values provided.")
+        self._validate_column_existence(table, *keys)
+        return value_keys
+
+    def bulk_update(
+        self, table, pk_col: str, records: List[Dict], chunk_size: int = 5000
+    ) -> None:
+        """
+        Updates multiple records with different values, matching each record by its key column.
+
+        The records are sent as executemany-style `UPDATE ... WHERE pk_col = ...` statements in chunks of
+        `chunk_size`, all within a single transaction.
+
+        Args:
+            table (Base): Table class for the records to update.
+            pk_col (str): The column identifying each record, usually the primary key.
+            records (List[dict]): A list of dictionaries holding `pk_col` and the new column values. All records
+                must contain the same columns.
+            chunk_size (int, optional): The maximum number of records sent per statement. Defaults to 5000.
+
+        Raises:
+            ValueError: If the records are inconsistent, a column does not exist or an update error occurs.
 
-                # Lock the selected rows for update
-                query = query.with_for_update()
+        Example:
+            >>> records = [{'id': 1, 'name': 'Jane Doe'}, {'id': 2, 'name': 'John Smith'}]
+            >>> bulk_update(User, 'id', records)
+            This would rename the User with 'id' 1 to 'Jane Doe' and the User with 'id' 2 to 'John Smith'.
+        """
+        if not records:
+            return
+        if chunk_size < 1:
+            raise ValueError("Chunk size must be a positive integer.")
+        value_keys = self._validate_bulk_update_records(table, pk_col, records)
+
+        stmt = _build_bulk_update(table, pk_col, value_keys)
+        params = [
+            {
+                f"filter_{pk_col}": record_data[pk_col],
+                **{f"value_{key}": record_data[key] for key in value_keys},
+            }
+            for record_data in records
+        ]
 
-                query.update(update_values, synchronize_session="fetch")
-                session.commit()
+        try:
+            with self._write_session() as session:
+                for chunk in _chunked(params, chunk_size):
+                    session.execute(stmt, chunk)
         except SQLAlchemyError as e:
             raise ValueError(f"An error occurred while updating records: {e}")
 
@@ -355,6 +1180,10 @@ class DBManager(ABC):
         """
         Deletes table records based on filters and conditions, optionally returns specific column values.
 
+        On dialects supporting `DELETE ... RETURNING`, the returned columns are fetched by the DELETE statement
+        itself; otherwise they are selected in the same transaction before deleting. Inside `session_scope`, deleted
+        instances loaded in the shared session are synchronized with the 'auto' strategy.
+
         Args:
             table (Base): Table class for the records to delete.
             complex_conditions (List, optional): Advanced SQLAlchemy filter conditions.
@@ -376,21 +1205,38 @@ class DBManager(ABC):
         """
         return_columns = return_columns or []
         self._validate_column_existence(table, *return_columns, **filters)
+        filters, complex_conditions = _split_filters(table, filters, complex_conditions)
+
+        # Without DELETE ... RETURNING support, the returned columns are selected before deleting
+        use_returning = bool(return_columns) and self._engine.dialect.delete_returning
+        params = _filter_params(filters)
+        if self._scoped.registry.has():
+            # Deleted instances of the shared session are synchronized, which requires inline criteria
+            stmt = delete(table).filter_by(**filters).execution_options(synchronize_session="auto")
+            if use_returning:
+                stmt = stmt.returning(*[getattr(table, column) for column in return_columns])
+            delete_params = {}
+        else:
+            stmt = _build_delete(
+                table, _filter_keys(filters), tuple(return_columns) if use_returning else ()
+            )
+            delete_params = params
+        if complex_conditions:
+            stmt = stmt.where(*complex_conditions)
 
         deleted_records = None
         try:
-            with self._session() as session:
-                query = session.query(table).filter_by(**filters)
-                if complex_conditions:
-                    for condition in complex_conditions:
-                        query = query.filter(condition)
-                if return_columns:
-                    deleted_records = query.with_entities(
-                        *[getattr(table, col) for col in return_columns]
-                    ).all()
-
-                deleted_count = query.delete()
-                session.commit()
+            with self._write_session() as session:
+                if use_returning:
+                    deleted_records = session.execute(stmt, delete_params).all()
+                    deleted_count = len(deleted_records)
+                else:
+                    if return_columns:
+                        select_stmt = _build_select(table, _filter_keys(filters), tuple(return_columns))
+                        if complex_conditions:
+                            select_stmt = select_stmt.where(*complex_conditions)
+                        deleted_records = session.execute(select_stmt, params).all()
+                    deleted_count = session.execute(stmt, delete_params).rowcount
 
                 if error_when_empty and deleted_count == 0:
                     raise ValueError("No records were deleted.")
@@ -401,6 +1247,56 @@ class DBManager(ABC):
             return deleted_records
         return None
 
+    def _upsert_statement(
+        self, table, conflict_cols: List[str], update_cols: List[str], record_values: Dict
+    ):
+        """Returns the dialect-specific `INSERT ... ON CONFLICT` statement for an upsert."""
+        raise ValueError(f"Upsert is not supported for dialect '{self.dialect}'.")
+
+    def upsert(
+        self,
+        table,
+        conflict_cols: List[str],
+        update_cols: Optional[List[str]] = None,
+        **values,
+    ) -> None:
+        """
+        Inserts a record, or updates the existing record when it conflicts on the given columns.
+
+        The insert and the update happen in a single atomic statement, replacing the
+        `exists` followed by `create` or `update` pattern and its race condition.
+
+        Args:
+            table (Base): The table class into which the record will be inserted.
+            conflict_cols (List[str]): Columns of the unique constraint identifying an existing record.
+            update_cols (List[str], optional): Columns to overwrite when the record already exists.
+                Defaults to every given column that is not in `conflict_cols`.
+            **values: Key-value pairs corresponding to the table column names and the values of the record.
+
+        Raises:
+            ValueError: If a column does not exist, a conflict column has no value, the dialect does not support
+                upserts or an upsert error occurs.
+
+        Example:
+            >>> upsert(User, ['email'], email='jane@example.com', name='Jane Doe')
+            This would create the User with email 'jane@example.com', or rename the existing one to 'Jane Doe'.
+        """
+        if not conflict_cols:
+            raise ValueError("No conflict columns provided.")
+        missing = [col for col in conflict_cols if col not in values]
+        if missing:
+            raise ValueError(f"No value provided for conflict column '{missing[0]}'.")
+        if update_cols is None:
+            update_cols = [col for col in values if col not in conflict_cols]
+        self._validate_column_existence(table, *update_cols, **values)
+
+        stmt = self._upsert_statement(table, conflict_cols, update_cols, values)
+        try:
+            with self._write_session() as session:
+                session.execute(stmt)
+        except SQLAlchemyError as e:
+            raise ValueError(f"An error occurred while upserting a record: {e}")
+
     ### Additional Operations ###
 
     def exists(
@@ -409,6 +1305,8 @@ class DBManager(ABC):
         """
         Checks if any records in the table match the given simple and complex conditions.
 
+        Issues a `SELECT 1 ... LIMIT 1` query, so no ORM instance is loaded for the matching row.
+
         Args:
             table (Base): The table class to check for existing records.
             complex_conditions (List, optional): Advanced SQLAlchemy filter conditions.
@@ -422,10 +1320,15 @@ class DBManager(ABC):
             Checks if there's at least one User named 'John Doe' over 18.
         """
         self._validate_column_existence(table, **filters)
+        filters, complex_conditions = _split_filters(table, filters, complex_conditions)
+
+        stmt = _build_exists(table, _filter_keys(filters))
+        if complex_conditions:
+            stmt = stmt.where(*complex_conditions)
+
+        with self._read_session() as session:
+            return session.execute(stmt, _filter_params(filters)).first() is not None
+
 
-        with self._session() as session:
-            query = session.query(table).filter_by(**filters)
-            if complex_conditions:
-                for condition in complex_conditions:
-                    query = query.filter(condition)
-            return query.first() is not None
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=lambda: DBManager.dispose_cached_engines(close=False))
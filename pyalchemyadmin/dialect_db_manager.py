@@ -1,6 +1,58 @@
-from sqlalchemy import text
+import datetime
+import decimal
+import io
+import re
+import uuid
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterator, List, Optional
 
-from .db_manager import DBManager
+from sqlalchemy import cast, column, inspect, text, update, values
+from sqlalchemy.exc import SQLAlchemyError
+
+from .db_manager import DBManager, _chunked
+
+
+# Python types whose `str()` is valid PostgreSQL COPY text input
+_COPY_TEXT_TYPES = (str, int, float, decimal.Decimal, datetime.date, datetime.time, uuid.UUID)
+
+
+def _copy_text_value(value: Any) -> str:
+    """Serializes a value into the text format expected by PostgreSQL's `COPY ... FROM STDIN`."""
+    if value is None:
+        return "\\N"
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
+
+
+# Plain or schema-qualified table name, the only form interpolated into lock commands
+_TABLE_NAME_PATTERN = re.compile(r"[A-Za-z_][A-Za-z0-9_]*(\.[A-Za-z_][A-Za-z0-9_]*)?")
+
+
+@lru_cache(maxsize=128)
+def _lock_clause(template: str, table_name: str):
+    """Builds a table lock command from a template, memoized per template and table name."""
+    if not _TABLE_NAME_PATTERN.fullmatch(table_name):
+        raise ValueError(f"Invalid table name '{table_name}'.")
+    return text(template.format(table=table_name))
+
+
+def _on_conflict_upsert(table, insert_stmt, conflict_cols: List[str], update_cols: List[str]):
+    """Adds an `ON CONFLICT` clause to a PostgreSQL or SQLite insert statement."""
+    # The columns are given by attribute key, which may differ from the column name in the table
+    columns = inspect(table).columns
+    index_elements = [columns[key] for key in conflict_cols]
+    if not update_cols:
+        return insert_stmt.on_conflict_do_nothing(index_elements=index_elements)
+    return insert_stmt.on_conflict_do_update(
+        index_elements=index_elements,
+        set_={columns[key]: insert_stmt.excluded[columns[key].key] for key in update_cols},
+    )
 
 
 class _DialectDBManager(DBManager):
@@ -17,6 +69,17 @@ class _DialectDBManager(DBManager):
         port: int = None,
         engine: str = "",
         echo: bool = False,
+        pool_size: int = 25,
+        max_overflow: int = 25,
+        pool_pre_ping: bool = True,
+        pool_recycle: int = 1800,
+        pool_timeout: int = 30,
+        prepared_statements: bool = True,
+        scopefunc: Optional[Callable[[], Any]] = None,
+        use_null_pool: bool = False,
+        expire_on_commit: bool = False,
+        query_cache_size: int = 1200,
+        insertmanyvalues_page_size: int = 1000,
     ):
         """
         Initializes the database engine and session.
@@ -29,6 +92,24 @@ class _DialectDBManager(DBManager):
             port (int): The port of the database.
             engine (str, optional): The engine of the database. Defaults to "".
             echo (bool, optional): If True, the engine will log all the SQL it executes. Defaults to False.
+            pool_size (int, optional): The number of connections kept open in the pool. Defaults to 25.
+            max_overflow (int, optional): The number of connections allowed beyond `pool_size`. Defaults to 25.
+            pool_pre_ping (bool, optional): If True, connections are tested before being checked out of the pool.
+                Defaults to True.
+            pool_recycle (int, optional): The number of seconds after which a pooled connection is replaced.
+                Defaults to 1800.
+            pool_timeout (int, optional): The number of seconds to wait for a free connection before giving up.
+                Defaults to 30.
+            prepared_statements (bool, optional): If False, turns off psycopg's server-side prepared statements.
+                Defaults to True.
+            scopefunc (Callable, optional): Returns the identifier of the current scope for `session_scope`.
+                Defaults to the current thread.
+            use_null_pool (bool, optional): If True, connections are closed on release instead of being pooled.
+                Defaults to False.
+            expire_on_commit (bool, optional): If True, instances are expired on commit. Defaults to False.
+            query_cache_size (int, optional): The number of compiled SQL statements cached by the engine.
+                Defaults to 1200.
+            insertmanyvalues_page_size (int, optional): The number of rows per multi-row INSERT. Defaults to 1000.
         """
         if port is None:
             port = self.default_port
@@ -42,6 +123,17 @@ class _DialectDBManager(DBManager):
             dialect=self.dialect,
             engine=engine,
             echo=echo,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_pre_ping=pool_pre_ping,
+            pool_recycle=pool_recycle,
+            pool_timeout=pool_timeout,
+            prepared_statements=prepared_statements,
+            scopefunc=scopefunc,
+            use_null_pool=use_null_pool,
+            expire_on_commit=expire_on_commit,
+            query_cache_size=query_cache_size,
+            insertmanyvalues_page_size=insertmanyvalues_page_size,
         )
 
 
@@ -50,7 +142,164 @@ class PostgreDBManager(_DialectDBManager):
     default_port = 5432
 
     def lock_table_command(self, table_name: str) -> text:
-        return text(f"LOCK TABLE {table_name} IN EXCLUSIVE MODE")
+        return _lock_clause("LOCK TABLE {table} IN EXCLUSIVE MODE", table_name)
+
+    def _upsert_statement(
+        self, table, conflict_cols: List[str], update_cols: List[str], record_values: Dict
+    ):
+        # Dialect modules are imported on first use, so only the dialects actually used are loaded
+        from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+        return _on_conflict_upsert(table, pg_insert(table).values(**record_values), conflict_cols, update_cols)
+
+    @contextmanager
+    def pipeline(self) -> Iterator:
+        """
+        Provides a transactional session whose connection runs in psycopg's pipeline mode.
+
+        Statements executed in the block are sent without waiting for each result, so a series of independent
+        writes costs close to one network round-trip instead of one per statement. The transaction is committed
+        when the block exits, or rolled back if it raises.
+
+        Yields:
+            Session: The session bound to the pipelined connection.
+
+        Raises:
+            ValueError: If the manager does not use the psycopg engine.
+
+        Example:
+            >>> with db.pipeline() as session:
+            ...     for event in events:
+            ...         session.execute(insert(Event), event)
+        """
+        if self._engine.dialect.driver != "psycopg":
+            raise ValueError("Pipeline mode requires the psycopg engine.")
+        with self._write_session() as session:
+            with session.connection().connection.driver_connection.pipeline():
+                yield session
+
+    def bulk_create(self, table, records: List[Dict], chunk_size: int = 1000) -> None:
+        """
+        Creates multiple new records in the specified table with the given values.
+
+        With the psycopg2 driver the records are streamed through a single `COPY ... FROM STDIN`
+        statement. Scalar column defaults are filled in and column type bind processors applied before
+        streaming, since COPY bypasses them. Other drivers, records with differing keys, callable or SQL
+        expression defaults, inheritance hierarchies, values without a plain text form (e.g. lists or bytes),
+        or calls inside `session_scope` fall back to `DBManager.bulk_create`.
+
+        Args:
+            table (Base): The table class into which the records will be inserted.
+            records (List[dict]): A list of dictionaries, where each dictionary represents a record to be inserted.
+            chunk_size (int, optional): The maximum number of records sent per INSERT statement
+                when falling back to `DBManager.bulk_create`. Defaults to 1000.
+
+        Raises:
+            ValueError: If an error occurs during the creation of the records or if a specified column in any of the
+                records does not exist in the table.
+        """
+        # COPY runs on its own raw connection, so it cannot join the transaction of `session_scope`
+        if not records or self._engine.dialect.driver != "psycopg2" or self._scoped.registry.has():
+            return super().bulk_create(table, records, chunk_size=chunk_size)
+
+        keys = set(records[0])
+        if any(set(record_data) != keys for record_data in records):
+            return super().bulk_create(table, records, chunk_size=chunk_size)
+        self._validate_column_existence(table, **records[0])
+
+        mapper = inspect(table)
+        if mapper.polymorphic_on is not None or len(mapper.tables) > 1:
+            return super().bulk_create(table, records, chunk_size=chunk_size)
+
+        mapper_columns = mapper.columns
+        defaults = {}
+        for key, column in mapper_columns.items():
+            if key in keys or column.default is None:
+                continue
+            if not column.default.is_scalar:
+                return super().bulk_create(table, records, chunk_size=chunk_size)
+            defaults[key] = column.default.arg
+        copy_keys = [key for key in mapper_columns.keys() if key in keys or key in defaults]
+
+        dialect = self._engine.dialect
+        processors = [
+            mapper_columns[key].type.dialect_impl(dialect).bind_processor(dialect) for key in copy_keys
+        ]
+
+        buffer = io.StringIO()
+        for record_data in records:
+            row = []
+            for key, processor in zip(copy_keys, processors):
+                value = record_data[key] if key in record_data else defaults[key]
+                if processor is not None:
+                    value = processor(value)
+                if value is not None and not isinstance(value, _COPY_TEXT_TYPES):
+                    return super().bulk_create(table, records, chunk_size=chunk_size)
+                row.append(value)
+            buffer.write("\t".join(_copy_text_value(value) for value in row) + "\n")
+        buffer.seek(0)
+
+        preparer = self._engine.dialect.identifier_preparer
+        column_names = ", ".join(preparer.quote(mapper_columns[key].name) for key in copy_keys)
+        copy_command = f"COPY {preparer.format_table(table.__table__)} ({column_names}) FROM STDIN"
+
+        connection = self._engine.raw_connection()
+        try:
+            cursor = connection.cursor()
+            cursor.copy_expert(copy_command, buffer)
+            cursor.close()
+            connection.commit()
+        except self._engine.dialect.dbapi.Error as e:
+            connection.rollback()
+            raise ValueError(f"An error occurred while creating records: {e}")
+        finally:
+            connection.close()
+
+    def bulk_update(
+        self, table, pk_col: str, records: List[Dict], chunk_size: int = 5000
+    ) -> None:
+        """
+        Updates multiple records with different values, matching each record by its key column.
+
+        Each chunk of `chunk_size` records is sent as a single `UPDATE ... FROM (VALUES ...)` statement,
+        so the server joins the new values against the table in one pass.
+
+        Args:
+            table (Base): Table class for the records to update.
+            pk_col (str): The column identifying each record, usually the primary key.
+            records (List[dict]): A list of dictionaries holding `pk_col` and the new column values. All records
+                must contain the same columns.
+            chunk_size (int, optional): The maximum number of records sent per statement. Defaults to 5000.
+
+        Raises:
+            ValueError: If the records are inconsistent, a column does not exist or an update error occurs.
+        """
+        if not records:
+            return
+        if chunk_size < 1:
+            raise ValueError("Chunk size must be a positive integer.")
+        value_keys = self._validate_bulk_update_records(table, pk_col, records)
+
+        mapper_columns = inspect(table).columns
+        keys = (pk_col, *value_keys)
+        value_columns = [column(key, mapper_columns[key].type) for key in keys]
+
+        try:
+            with self._write_session() as session:
+                for chunk in _chunked(records, chunk_size):
+                    new_values = values(*value_columns, name="new_values").data(
+                        [tuple(record_data[key] for key in keys) for record_data in chunk]
+                    )
+                    # VALUES literals are untyped on the server, so they are cast to the column types
+                    typed = {key: cast(new_values.c[key], mapper_columns[key].type) for key in keys}
+                    stmt = (
+                        update(table.__table__)
+                        .where(mapper_columns[pk_col] == typed[pk_col])
+                        .values({mapper_columns[key]: typed[key] for key in value_keys})
+                    )
+                    session.execute(stmt)
+        except SQLAlchemyError as e:
+            raise ValueError(f"An error occurred while updating records: {e}")
 
 
 class MySQLDBManager(_DialectDBManager):
@@ -58,7 +307,20 @@ class MySQLDBManager(_DialectDBManager):
     default_port = 3306
 
     def lock_table_command(self, table_name: str) -> text:
-        return text(f"LOCK TABLES {table_name} WRITE")
+        return _lock_clause("LOCK TABLES {table} WRITE", table_name)
+
+    def _upsert_statement(
+        self, table, conflict_cols: List[str], update_cols: List[str], record_values: Dict
+    ):
+        # MySQL matches any unique key, and needs at least one assignment even when nothing is updated
+        from sqlalchemy.dialects.mysql import insert as mysql_insert
+
+        stmt = mysql_insert(table).values(**record_values)
+        columns = inspect(table).columns
+        update_cols = update_cols or conflict_cols[:1]
+        return stmt.on_duplicate_key_update(
+            {columns[key]: stmt.inserted[columns[key].key] for key in update_cols}
+        )
 
 
 class OracleDBManager(_DialectDBManager):
@@ -66,7 +328,7 @@ class OracleDBManager(_DialectDBManager):
     default_port = 1521
 
     def lock_table_command(self, table_name: str) -> text:
-        return text(f"LOCK TABLE {table_name} IN EXCLUSIVE MODE")
+        return _lock_clause("LOCK TABLE {table} IN EXCLUSIVE MODE", table_name)
 
 
 class MicrosoftSQLServerDBManager(_DialectDBManager):
@@ -74,19 +336,21 @@ class MicrosoftSQLServerDBManager(_DialectDBManager):
     default_port = 1433
 
     def lock_table_command(self, table_name: str) -> text:
-        return text(f"SELECT * FROM {table_name} WITH (TABLOCKX)")
+        return _lock_clause("SELECT * FROM {table} WITH (TABLOCKX)", table_name)
 
 
 class SQLiteDBManager(_DialectDBManager):
     dialect = "sqlite"
 
-    def __init__(self, *, database: str, echo: bool = False):
+    def __init__(self, *, database: str, echo: bool = False, use_null_pool: bool = False):
         """
         Initializes the database engine and session.
 
         Args:
             database (str): The name of the database.
             echo (bool, optional): If True, the engine will log all the SQL it executes. Defaults to False.
+            use_null_pool (bool, optional): If True, connections are closed on release instead of being pooled.
+                Ignored for `:memory:` databases. Defaults to False.
         """
         super().__init__(
             database=database,
@@ -94,15 +358,22 @@ class SQLiteDBManager(_DialectDBManager):
             password="",
             host="",
             port=None,
-            dialect=SQLiteDBManager.dialect,
             engine="",
             echo=echo,
+            use_null_pool=use_null_pool,
         )
 
     def lock_table_command(self, table_name: str) -> text:
         # SQLite does not support table locking
         pass
 
+    def _upsert_statement(
+        self, table, conflict_cols: List[str], update_cols: List[str], record_values: Dict
+    ):
+        from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+        return _on_conflict_upsert(table, sqlite_insert(table).values(**record_values), conflict_cols, update_cols)
+
 
 __all__ = [
     "PostgreDBManager",
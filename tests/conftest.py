@@ -0,0 +1,19 @@
+import pytest
+
+from pyalchemyadmin import SQLiteDBManager
+
+from .models import define_models
+
+
+@pytest.fixture
+def db():
+    manager = SQLiteDBManager(database=":memory:")
+    yield manager
+    manager._engine.dispose()
+
+
+@pytest.fixture
+def models(db):
+    models = define_models(db.base)
+    db.create_all_tables()
+    return models
@@ -0,0 +1,34 @@
+from functools import lru_cache
+from types import SimpleNamespace
+
+from sqlalchemy import Column, ForeignKey, Integer, Text
+from sqlalchemy.orm import relationship
+
+
+@lru_cache(maxsize=None)
+def define_models(base):
+    """Maps the test tables on `base`, once per declarative base."""
+
+    class Author(base):
+        __tablename__ = "authors"
+
+        id = Column(Integer, primary_key=True)
+        name = Column(Text)
+        views = Column(Integer, default=0)
+        books = relationship("Book")
+
+    class Book(base):
+        __tablename__ = "books"
+
+        id = Column(Integer, primary_key=True)
+        title = Column(Text, nullable=False)
+        author_id = Column(ForeignKey("authors.id"))
+
+    class Tag(base):
+        __tablename__ = "tags"
+
+        id = Column(Integer, primary_key=True)
+        label = Column("the label", Text, unique=True)
+        uses = Column(Integer, default=0)
+
+    return SimpleNamespace(Author=Author, Book=Book, Tag=Tag)
@@ -0,0 +1,74 @@
+import asyncio
+
+import pytest
+
+from pyalchemyadmin import AsyncDBManager
+
+from .models import define_models
+
+pytest.importorskip("aiosqlite")
+
+
+@pytest.fixture
+def run():
+    """Runs an async test body against a fresh in-memory aiosqlite database."""
+
+    def run(test):
+        async def main():
+            manager = AsyncDBManager(database=":memory:", dialect="sqlite")
+            models = define_models(manager.base)
+            await manager.create_all_tables()
+            try:
+                await test(manager, models)
+            finally:
+                await manager.dispose()
+
+        asyncio.run(main())
+
+    return run
+
+
+def test_create_retrieve_and_exists(run):
+    async def test(db, models):
+        Author = models.Author
+        assert await db.create(Author, name="Jane") is None
+        author = await db.create(Author, return_object=True, name=None)
+
+        assert author.id == 2
+        assert [a.id for a in await db.retrieve(Author, name=None)] == [2]
+        assert (await db.retrieve(Author, fetch_mode="one", name="Jane")).views == 0
+        assert await db.retrieve(Author, return_columns=["name"], views=Author.id - 1) == [("Jane",)]
+        assert await db.exists(Author, name="Jane")
+        assert not await db.exists(Author, name="John")
+
+    run(test)
+
+
+def test_retrieve_with_eager_relationship(run):
+    async def test(db, models):
+        await db.create(models.Author, name="Jane")
+        await db.create(models.Book, title="Book", author_id=1)
+
+        [author] = await db.retrieve(models.Author, eager=["books"])
+
+        assert [book.title for book in author.books] == ["Book"]
+        with pytest.raises(ValueError, match="Relationship 'reviews' does not exist"):
+            await db.retrieve(models.Author, eager=["reviews"])
+
+    run(test)
+
+
+def test_execute(run):
+    async def test(db, models):
+        await db.execute("INSERT INTO authors (name, views) VALUES (:name, 3)", {"name": "Jane"})
+
+        rows = await db.execute("SELECT name, views FROM authors", fetch=True)
+
+        assert rows == [("Jane", 3)]
+
+    run(test)
+
+
+def test_rejects_unsupported_engine():
+    with pytest.raises(ValueError, match="not supported"):
+        AsyncDBManager(database=":memory:", dialect="sqlite", engine="pysqlite")
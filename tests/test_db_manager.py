@@ -0,0 +1,262 @@
+import pytest
+from sqlalchemy import select
+from sqlalchemy.exc import InvalidRequestError
+
+from .models import define_models
+
+
+def test_bulk_create_inserts_every_chunk(db, models):
+    db.bulk_create(models.Book, [{"title": f"Book {i}"} for i in range(5)], chunk_size=2)
+
+    titles = db.retrieve(models.Book, return_columns=["title"])
+    assert sorted(title for (title,) in titles) == [f"Book {i}" for i in range(5)]
+
+
+def test_bulk_create_rejects_invalid_input(db, models):
+    with pytest.raises(ValueError, match="Chunk size"):
+        db.bulk_create(models.Book, [{"title": "Book"}], chunk_size=0)
+    with pytest.raises(ValueError, match="Column 'isbn' does not exist"):
+        db.bulk_create(models.Book, [{"title": "Book", "isbn": "123"}])
+    assert db.retrieve(models.Book) == []
+
+
+def test_retrieve_and_exists_with_none_filter(db, models):
+    db.create(models.Author, name=None)
+    db.create(models.Author, name="Jane")
+
+    assert len(db.retrieve(models.Author, name=None)) == 1
+    assert db.exists(models.Author, name=None)
+    assert db.retrieve(models.Author, fetch_mode="one", name="Jane").name == "Jane"
+    assert not db.exists(models.Author, name="John")
+
+
+def test_update_with_none_filter_and_expressions(db, models):
+    Author = models.Author
+    db.create(Author, name=None, views=1)
+    db.create(Author, name="Jane", views=5)
+    db.create(Author, name="John", views=3)
+
+    db.update(Author, {"views": 7}, name=None)
+    db.update(Author, {"views": Author.views + 1}, name="Jane")
+    db.update(Author, {"name": "Joan"}, views=Author.id)
+
+    assert db.retrieve(Author, fetch_mode="one", name=None).views == 7
+    assert db.retrieve(Author, fetch_mode="one", name="Jane").views == 6
+    assert db.retrieve(Author, fetch_mode="one", id=3).name == "Joan"
+
+
+def test_expression_filters(db, models):
+    Author = models.Author
+    db.create(Author, name="Jane", views=1)
+    db.create(Author, name="John", views=5)
+
+    assert db.retrieve(Author, return_columns=["name"], views=Author.id) == [("Jane",)]
+    assert db.exists(Author, views=Author.id)
+    assert db.delete(Author, return_columns=["name"], views=Author.id) == [("Jane",)]
+    assert not db.exists(Author, views=Author.id)
+
+
+def test_delete_with_none_filter(db, models):
+    Author = models.Author
+    db.create(Author, name=None)
+    db.create(Author, name="Jane")
+
+    deleted = db.delete(Author, return_columns=["name"], name=None)
+
+    assert deleted == [(None,)]
+    assert db.retrieve(Author, return_columns=["name"]) == [("Jane",)]
+    with pytest.raises(ValueError):
+        db.delete(Author, error_when_empty=True, name=None)
+
+
+def test_unknown_column_raises(db, models):
+    with pytest.raises(ValueError, match="Column 'age' does not exist"):
+        db.retrieve(models.Author, age=30)
+
+
+def test_bulk_update_matches_records_by_key(db, models):
+    Author = models.Author
+    db.bulk_create(Author, [{"name": name, "views": 0} for name in ("Jane", "John", "Joan")])
+
+    db.bulk_update(Author, "id", [{"id": 1, "views": 10}, {"id": 3, "views": 30}], chunk_size=1)
+
+    views = db.retrieve(Author, return_columns=["name", "views"])
+    assert sorted(views) == [("Jane", 10), ("Joan", 30), ("John", 0)]
+
+
+def test_bulk_update_rejects_invalid_records(db, models):
+    Author = models.Author
+    with pytest.raises(ValueError, match="key column 'id'"):
+        db.bulk_update(Author, "id", [{"views": 1}])
+    with pytest.raises(ValueError, match="same columns"):
+        db.bulk_update(Author, "id", [{"id": 1, "views": 1}, {"id": 2, "name": "Jane"}])
+    with pytest.raises(ValueError, match="No update values"):
+        db.bulk_update(Author, "id", [{"id": 1}])
+
+
+def test_create_returns_object_with_primary_key(db, models):
+    assert db.create(models.Author, name="Jane") is None
+
+    author = db.create(models.Author, return_object=True, name="John")
+
+    assert author.id == 2
+    assert author.views == 0
+
+
+def test_iter_retrieve_pages_through_matching_records(db, models):
+    Author = models.Author
+    db.bulk_create(Author, [{"name": None if i % 2 else f"Author {i}"} for i in range(7)])
+
+    records = db.iter_retrieve(Author, pk_col="id", batch_size=2, name=None)
+
+    assert [author.id for author in records] == [2, 4, 6]
+    assert len(list(db.iter_retrieve(Author, pk_col="id", batch_size=3))) == 7
+
+
+def test_iter_retrieve_validates_on_call(db, models):
+    with pytest.raises(ValueError, match="Batch size"):
+        db.iter_retrieve(models.Author, pk_col="id", batch_size=0)
+    with pytest.raises(ValueError, match="Column 'age' does not exist"):
+        db.iter_retrieve(models.Author, pk_col="id", age=30)
+
+
+def test_upsert_inserts_then_updates(db, models):
+    Author = models.Author
+    db.upsert(Author, ["id"], id=1, name="Jane", views=1)
+    db.upsert(Author, ["id"], id=1, name="Joan", views=2)
+    db.upsert(Author, ["id"], update_cols=[], id=1, name="John")
+
+    assert db.retrieve(Author, return_columns=["id", "name", "views"]) == [(1, "Joan", 2)]
+
+
+def test_upsert_on_column_named_apart_from_its_attribute(db, models):
+    Tag = models.Tag
+    db.upsert(Tag, ["label"], label="python", uses=1)
+    db.upsert(Tag, ["label"], label="python", uses=5)
+
+    assert db.retrieve(Tag, return_columns=["label", "uses"]) == [("python", 5)]
+
+
+def test_upsert_rejects_missing_conflict_value(db, models):
+    with pytest.raises(ValueError, match="conflict column 'id'"):
+        db.upsert(models.Author, ["id"], name="Jane")
+
+
+def test_count_queries_with_eager_loading(db, models):
+    for name in ("Jane", "John", "Joan"):
+        author = db.create(models.Author, return_object=True, name=name)
+        db.bulk_create(models.Book, [{"title": f"{name} {i}", "author_id": author.id} for i in range(3)])
+
+    with db.count_queries() as queries:
+        authors = db.retrieve(models.Author, eager=["books"])
+        titles = [book.title for author in authors for book in author.books]
+
+    assert len(titles) == 9
+    assert len(queries) == 2
+
+
+def test_session_scope_commits_and_synchronizes(db, models):
+    Author = models.Author
+    with db.session_scope():
+        author = db.create(Author, return_object=True, name="Jane")
+        assert author.id is not None
+        db.update(Author, {"views": 3}, id=author.id)
+        assert author.views == 3
+        db.delete(Author, name=None)
+
+    assert db.retrieve(Author, fetch_mode="one", name="Jane").views == 3
+
+
+def test_session_scope_rolls_back_nested_scopes(db, models):
+    Author = models.Author
+    with pytest.raises(RuntimeError):
+        with db.session_scope():
+            db.create(Author, name="outer")
+            with db.session_scope():
+                db.create(Author, name="inner")
+            db.create(Author, name="after_inner")
+            raise RuntimeError
+
+    assert db.retrieve(Author) == []
+
+
+def test_session_scope_synchronizes_expression_updates(db, models):
+    Author = models.Author
+    with db.session_scope():
+        author = db.create(Author, return_object=True, name="Jane", views=1)
+        db.update(Author, {"views": Author.views + 1}, views=Author.id)
+        assert author.views == 2
+        db.delete(Author, views=Author.id + 1)
+        assert not db.exists(Author)
+
+
+def test_execute_many_consumes_parameters_in_chunks(db, models):
+    query = "INSERT INTO books (title) VALUES (:title)"
+    db.execute_many(query, ({"title": f"Book {i}"} for i in range(5)), chunk_size=2)
+
+    assert len(db.retrieve(models.Book)) == 5
+    with pytest.raises(ValueError, match="executing the command"):
+        db.execute_many(query, [{"title": "Book 5"}, {"title": None}], chunk_size=1)
+    assert len(db.retrieve(models.Book)) == 5
+
+
+def test_execute_stream_yields_rows(db, models):
+    db.bulk_create(models.Book, [{"title": f"Book {i}"} for i in range(5)])
+
+    rows = db.execute_stream("SELECT title FROM books WHERE id > :id ORDER BY id", {"id": 2}, yield_per=2)
+
+    assert [title for (title,) in rows] == ["Book 2", "Book 3", "Book 4"]
+
+
+def test_execute_mappings_returns_dicts(db, models):
+    db.create(models.Author, name="Jane", views=3)
+
+    [author] = db.execute_mappings("SELECT name, views FROM authors WHERE name = :name", {"name": "Jane"})
+
+    assert author["name"] == "Jane"
+    assert dict(author) == {"name": "Jane", "views": 3}
+
+
+def test_orm_query_loads_selectin_and_raises_on_other_relationships(db, models):
+    Author, Book = models.Author, models.Book
+    db.create(Author, name="Jane")
+    db.bulk_create(Book, [{"title": f"Book {i}", "author_id": 1} for i in range(2)])
+
+    [author] = db.orm_query(select(Author), selectin=[Author.books])
+    [lazy_author] = db.orm_query(select(Author))
+
+    assert sorted(book.title for book in author.books) == ["Book 0", "Book 1"]
+    with pytest.raises(InvalidRequestError):
+        lazy_author.books
+
+
+def test_assert_max_queries(db, models):
+    db.create(models.Author, name="Jane")
+
+    with db.assert_max_queries(2):
+        db.retrieve(models.Author, eager=["books"])
+    with pytest.raises(AssertionError, match="Expected at most 1 queries"):
+        with db.assert_max_queries(1):
+            db.retrieve(models.Author, eager=["books"])
+
+
+def test_execute_first_returns_first_row_or_none(db, models):
+    db.bulk_create(models.Author, [{"name": "Jane"}, {"name": "John"}])
+
+    assert db.execute_first("SELECT name FROM authors ORDER BY id") == ("Jane",)
+    assert db.execute_first("SELECT name FROM authors WHERE name = :name", {"name": "Joan"}) is None
+
+
+def test_create_all_tables_fast_creates_only_missing_tables(db):
+    models = define_models(db.base)
+    db.execute("CREATE TABLE authors (id INTEGER PRIMARY KEY, name TEXT, views INTEGER)")
+    db.execute("INSERT INTO authors (name) VALUES ('Jane')")
+
+    with db.count_queries() as queries:
+        db.create_all_tables(fast=True)
+        db.create_all_tables(fast=True)
+
+    assert not any("CREATE TABLE authors" in query for query in queries)
+    assert any("CREATE TABLE books" in query for query in queries)
+    assert db.retrieve(models.Author, return_columns=["name"]) == [("Jane",)]
+    db.create(models.Book, title="Book", author_id=1)
@@ -0,0 +1,127 @@
+import datetime
+from functools import lru_cache
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import JSON, Column, DateTime, Integer, LargeBinary, Text
+
+from pyalchemyadmin import DBManager, PostgreDBManager
+
+from .models import define_models
+
+
+@lru_cache(maxsize=None)
+def _define_models(base):
+    class Event(base):
+        __tablename__ = "events"
+
+        id = Column(Integer, primary_key=True)
+        payload = Column(JSON)
+        status = Column(Text, default="new")
+        created = Column(DateTime, default=datetime.datetime.now)
+        attachment = Column(LargeBinary)
+
+    class Pet(base):
+        __tablename__ = "pets"
+        __mapper_args__ = {"polymorphic_on": "kind", "polymorphic_identity": "pet"}
+
+        id = Column(Integer, primary_key=True)
+        kind = Column(Text)
+        name = Column(Text)
+
+    class Dog(Pet):
+        __mapper_args__ = {"polymorphic_identity": "dog"}
+
+    return SimpleNamespace(Event=Event, Dog=Dog)
+
+
+class _CopyConnection:
+    """Stands in for a psycopg2 raw connection and records the COPY payloads."""
+
+    def __init__(self):
+        self.copied = []
+
+    def cursor(self):
+        return self
+
+    def copy_expert(self, command, buffer):
+        self.copied.append((command, buffer.read()))
+
+    def close(self):
+        pass
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+
+@pytest.fixture
+def pg_db(monkeypatch):
+    pytest.importorskip("psycopg2")
+    manager = PostgreDBManager(
+        database="test", user="user", password="password", host="localhost", engine="psycopg2"
+    )
+    connection = _CopyConnection()
+    fallbacks = []
+    monkeypatch.setattr(manager._engine, "raw_connection", lambda: connection)
+    monkeypatch.setattr(
+        DBManager,
+        "bulk_create",
+        lambda self, table, records, chunk_size=1000: fallbacks.append(table),
+    )
+    return SimpleNamespace(
+        manager=manager,
+        models=_define_models(manager.base),
+        copied=connection.copied,
+        fallbacks=fallbacks,
+    )
+
+
+def test_bulk_create_copies_processed_values(pg_db):
+    created = datetime.datetime(2024, 1, 2, 3, 4, 5)
+    pg_db.manager.bulk_create(
+        pg_db.models.Event,
+        [{"id": 1, "payload": {"tag": "a\tb"}, "created": created}],
+    )
+
+    assert pg_db.fallbacks == []
+    [(command, rows)] = pg_db.copied
+    assert command == "COPY events (id, payload, status, created) FROM STDIN"
+    assert rows == '1\t{"tag": "a\\\\tb"}\tnew\t2024-01-02 03:04:05\n'
+
+
+@pytest.mark.parametrize(
+    "model, record",
+    [
+        ("Event", {"id": 1}),
+        ("Event", {"id": 1, "created": None, "attachment": b"\x00"}),
+        ("Dog", {"name": "Rex"}),
+    ],
+    ids=["callable_default", "bytes_value", "single_table_inheritance"],
+)
+def test_bulk_create_falls_back_to_insert(pg_db, model, record):
+    table = getattr(pg_db.models, model)
+    pg_db.manager.bulk_create(table, [record])
+
+    assert pg_db.copied == []
+    assert pg_db.fallbacks == [table]
+
+
+def test_upsert_statement_uses_column_names(pg_db):
+    Tag = define_models(pg_db.manager.base).Tag
+    stmt = pg_db.manager._upsert_statement(Tag, ["label"], ["uses"], {"label": "python", "uses": 1})
+
+    sql = str(stmt.compile(dialect=pg_db.manager._engine.dialect))
+    assert 'ON CONFLICT ("the label") DO UPDATE SET uses = excluded.uses' in sql
+
+
+def test_lock_table_command_validates_table_name(pg_db):
+    command = pg_db.manager.lock_table_command("public.events")
+
+    assert str(command) == "LOCK TABLE public.events IN EXCLUSIVE MODE"
+    assert pg_db.manager.lock_table_command("public.events") is command
+    for table_name in ("events; DROP TABLE events", "1events", "a.b.c", ""):
+        with pytest.raises(ValueError, match="Invalid table name"):
+            pg_db.manager.lock_table_command(table_name)